@@ -1,11 +1,24 @@
 import os
 import json
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from PIL import Image, ImageTk, ImageOps
 
 CONFIG_FILE = 'config.json'
 
+# Default keys for rapid annotation mode, can be overridden with 'rapid_keys' in config.json
+RAPID_KEYS = {
+    'commit': 'Return',
+    'next_field': 'Down',
+    'prev_field': 'Up',
+    'clear': '0'
+}
+# Keys assigned in order to the values of each field, overridable with 'rapid_bindings'
+RAPID_VALUE_KEYS = '123456789'
+
 class ImageAnnotator:
     def __init__(self, root):
         self.root = root
@@ -20,13 +33,39 @@ class ImageAnnotator:
         self.omitted_reasons = {}
         self.current_image_index = -1
         self.annotations = {}
+        self.current_image = None
+        self.annotation_fields = {}
+
+        # Rapid annotation mode state
+        self.rapid_keys = dict(RAPID_KEYS)
+        self.rapid_bindings = {}
+        self.rapid_config = {}  # Rapid settings exactly as the user wrote them in config.json
+        self.rapid_key_overrides = {}
+        self.rapid_binding_overrides = {}
+        self.rapid_sequences = []
+        self.rapid_field_index = 0
+        self.rapid_commit_count = 0
+        self.rapid_start_time = 0.0
+
+        # Annotations are written to disk on a background thread so saving never blocks the UI
+        self.write_lock = threading.Lock()
+        self.write_event = threading.Event()
+        self.pending_write = None
+        self.writer_running = True
+        self.write_errors = queue.Queue()  # Errors from the writer thread, shown by the Tk thread
+        self.writer_thread = threading.Thread(target=self.annotation_writer, daemon=True)
+        self.writer_thread.start()
 
         self.create_widgets()
+        self.merge_rapid_config()
         self.load_config()
         self.populate_image_list()  # Populate the image list after loading config
         self.update_annotation_state()
 
         self.root.bind("<Configure>", self.on_resize)  # Bind the resize event
+        self.root.bind("<F2>", self.toggle_rapid_mode_key)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(500, self.check_write_errors)
 
     def on_resize(self, event):
         self.options_frame.configure(scrollregion=self.options_frame.bbox("all"))
@@ -40,6 +79,7 @@ class ImageAnnotator:
                 self.json_file = config.get('json_file', "")
                 self.omitted_images = config.get('omitted_images', [])
                 self.omitted_reasons = config.get('omitted_reasons', {})
+                self.load_rapid_config(config)
 
                 self.input_path_label.config(text=f"Input Folder: {self.image_folder if self.image_folder else 'No folder selected'}")
                 self.output_path_label.config(text=f"Output Folder: {self.output_folder if self.output_folder else 'No folder selected'}")
@@ -48,6 +88,75 @@ class ImageAnnotator:
                 if self.json_file and os.path.exists(self.json_file):
                     self.load_annotations(from_startup=True)
 
+    def load_rapid_config(self, config):
+        errors = []
+        for name in ['rapid_keys', 'rapid_bindings']:
+            if name in config:
+                self.rapid_config[name] = config[name]
+
+        rapid_keys = config.get('rapid_keys', {})
+        if not isinstance(rapid_keys, dict):
+            errors.append(f"rapid_keys must be an object, got {rapid_keys!r}")
+            rapid_keys = {}
+        rapid_bindings = config.get('rapid_bindings', {})
+        if not isinstance(rapid_bindings, dict):
+            errors.append(f"rapid_bindings must be an object, got {rapid_bindings!r}")
+            rapid_bindings = {}
+
+        for action, key in rapid_keys.items():
+            if action not in RAPID_KEYS or not isinstance(key, str) or not key:
+                errors.append(f"Invalid rapid key {action!r}: {key!r}")
+            elif key == "F2":
+                errors.append(f"Rapid key {action!r} cannot use F2, it toggles Rapid Mode")
+            else:
+                self.rapid_key_overrides[action] = key
+
+        for field, bindings in rapid_bindings.items():
+            if field not in self.annotation_fields or not isinstance(bindings, dict):
+                errors.append(f"Invalid rapid bindings for {field!r}")
+                continue
+            _, options, _ = self.annotation_fields[field]
+            valid_bindings = {}
+            for key, value in bindings.items():
+                # Compare types as well so 1 is not accepted for True on yes/no fields
+                if not (isinstance(key, str) and key and value != "" and any(value == option and type(value) is type(option) for option in options)):
+                    errors.append(f"Invalid rapid binding for {field!r}: {key!r} -> {value!r}")
+                elif key == "F2":
+                    errors.append(f"Rapid binding for {field!r} cannot use F2, it toggles Rapid Mode")
+                else:
+                    valid_bindings[key] = value
+            # Keep the generated keys if nothing the user supplied for this field was usable
+            if valid_bindings or not bindings:
+                self.rapid_binding_overrides[field] = valid_bindings
+
+        # A key used by more than one control, or by a control and a field value, would shadow the other
+        self.merge_rapid_config()
+        binding_keys = {key for bindings in self.rapid_bindings.values() for key in bindings}
+        for action, key in list(self.rapid_key_overrides.items()):
+            if key in binding_keys or list(self.rapid_keys.values()).count(key) > 1:
+                errors.append(f"Rapid key {action!r}: {key!r} is already used by another rapid key or field binding")
+                del self.rapid_key_overrides[action]
+        self.merge_rapid_config()
+        control_keys = set(self.rapid_keys.values())
+        for field, bindings in list(self.rapid_binding_overrides.items()):
+            colliding_keys = [key for key in bindings if key in control_keys]
+            for key in colliding_keys:
+                errors.append(f"Rapid binding for {field!r}: {key!r} is already used by a rapid key")
+                del bindings[key]
+            if colliding_keys and not bindings:
+                del self.rapid_binding_overrides[field]
+        self.merge_rapid_config()
+
+        if errors:
+            messagebox.showerror("Error", "Ignored invalid rapid mode settings in config.json:\n\n" + "\n".join(errors))
+
+    def merge_rapid_config(self):
+        # Generated defaults follow the current fields, user overrides are layered on top
+        self.rapid_keys = dict(RAPID_KEYS)
+        self.rapid_keys.update(self.rapid_key_overrides)
+        self.rapid_bindings = self.default_rapid_bindings()
+        self.rapid_bindings.update(self.rapid_binding_overrides)
+
     def save_config(self):
         config = {
             'image_folder': self.image_folder,
@@ -56,6 +165,7 @@ class ImageAnnotator:
             'omitted_images': self.omitted_images,
             'omitted_reasons': self.omitted_reasons
         }
+        config.update(self.rapid_config)
         with open(CONFIG_FILE, 'w') as file:
             json.dump(config, file)
 
@@ -98,7 +208,8 @@ class ImageAnnotator:
             "\n1. Select an input folder containing the images you want to annotate.\n"
             "\n2. Select an output folder where the annotations will be saved.\n"
             "\n3. Optionally, load an existing JSON file to continue annotations.\n"
-            "\n4. Click 'Start Annotation' to begin annotating the images."
+            "\n4. Click 'Start Annotation' to begin annotating the images.\n"
+            "\n5. Press F2 on the Annotate page to toggle Rapid Mode and annotate with the keyboard."
         )
         self.instructions_label = ttk.Label(self.welcome_frame, text=instructions_text, font=("Helvetica", 10, "bold"))
         self.instructions_label.pack(pady=20)
@@ -146,6 +257,13 @@ class ImageAnnotator:
         self.next_unannotated_btn = ttk.Button(self.image_frame, text="Next Unannotated Image", command=self.next_unannotated_image)
         self.next_unannotated_btn.pack(pady=10)
 
+        self.rapid_mode_var = tk.BooleanVar()
+        self.rapid_mode_check = ttk.Checkbutton(self.image_frame, text="Rapid Mode (F2)", variable=self.rapid_mode_var, command=self.toggle_rapid_mode)
+        self.rapid_mode_check.pack(pady=(10, 0))
+
+        self.rapid_hint_label = ttk.Label(self.image_frame, text="", wraplength=500, justify='center')
+        self.rapid_hint_label.pack(pady=(5, 10))
+
         self.search_frame = ttk.Frame(self.image_frame)
         self.search_frame.pack(pady=10)
 
@@ -179,6 +297,7 @@ class ImageAnnotator:
         self.options_frame.create_window((0, 0), window=self.options_inner_frame, anchor='nw')
 
         self.create_annotation_fields()
+        self.annotation_field_keys = list(self.annotation_fields)
 
         # Bind mouse wheel to horizontal scrollbar
         self.options_frame.bind("<Enter>", self.bind_mousewheel)
@@ -269,13 +388,13 @@ class ImageAnnotator:
         hair_attributes_label.pack(fill='x', pady=(5, 0))
 
         self.hair_color_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Hair Color:", self.hair_color_var, ["", "black", "brown", "blonde", "red", "gray",  "pink", "other"])
+        self.create_label_and_radiobuttons("hair_color", "Hair Color:", self.hair_color_var, ["", "black", "brown", "blonde", "red", "gray",  "pink", "other"])
 
         self.hair_length_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Hair Length:", self.hair_length_var, ["", "short", "medium", "long"])
+        self.create_label_and_radiobuttons("hair_length", "Hair Length:", self.hair_length_var, ["", "short", "medium", "long"])
 
         self.hair_style_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Hair Style:", self.hair_style_var, ["", "straight", "wavy", "curly", "bald"])
+        self.create_label_and_radiobuttons("hair_style", "Hair Style:", self.hair_style_var, ["", "straight", "wavy", "curly", "bald"])
 
         # Divider
         self.create_divider()
@@ -285,7 +404,7 @@ class ImageAnnotator:
         eye_attributes_label.pack(fill='x', pady=(5, 0))
 
         self.eye_color_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Eye Color:", self.eye_color_var, ["", "blue", "green", "brown", "gray","black", "other"])
+        self.create_label_and_radiobuttons("eye_color", "Eye Color:", self.eye_color_var, ["", "blue", "green", "brown", "gray","black", "other"])
 
         # Divider
         self.create_divider()
@@ -296,8 +415,8 @@ class ImageAnnotator:
 
         self.glasses_var = tk.BooleanVar()
         self.glasses_type_var = tk.StringVar()
-        self.create_label_and_checkbutton("Glasses:", self.glasses_var)
-        self.create_label_and_radiobuttons("Glasses Type:", self.glasses_type_var, ["", "reading glasses", "sunglasses", "other"])
+        self.create_label_and_checkbutton("glasses", "Glasses:", self.glasses_var)
+        self.create_label_and_radiobuttons("glasses_type", "Glasses Type:", self.glasses_type_var, ["", "reading glasses", "sunglasses", "other"])
 
         # Divider
         self.create_divider()
@@ -308,8 +427,8 @@ class ImageAnnotator:
 
         self.hat_var = tk.BooleanVar()
         self.hat_type_var = tk.StringVar()
-        self.create_label_and_checkbutton("Wearing Hat:", self.hat_var)
-        self.create_label_and_radiobuttons("Hat Type:", self.hat_type_var, ["", "cap", "beanie", "fedora", "other"])
+        self.create_label_and_checkbutton("hat", "Wearing Hat:", self.hat_var)
+        self.create_label_and_radiobuttons("hat_type", "Hat Type:", self.hat_type_var, ["", "cap", "beanie", "fedora", "other"])
 
         # Divider
         self.create_divider()
@@ -319,10 +438,10 @@ class ImageAnnotator:
         facial_structure_label.pack(fill='x', pady=(5, 0))
 
         self.face_shape_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Face Shape:", self.face_shape_var, ["", "round", "oval", "square", "heart"])
+        self.create_label_and_radiobuttons("face_shape", "Face Shape:", self.face_shape_var, ["", "round", "oval", "square", "heart"])
 
         self.ethnicity_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Ethnicity:", self.ethnicity_var, ["", "asian", "black", "caucasian", "hispanic","indian",  "other"])
+        self.create_label_and_radiobuttons("ethnicity", "Ethnicity:", self.ethnicity_var, ["", "asian", "black", "caucasian", "hispanic","indian",  "other"])
 
         # Divider
         self.create_divider()
@@ -332,18 +451,18 @@ class ImageAnnotator:
         additional_attributes_label.pack(fill='x', pady=(5, 0))
 
         self.age_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Age Range:", self.age_var, ["", "0-10", "11-20", "21-30", "31-40", "41-50", "51-60", "61-70", "71+"])
+        self.create_label_and_radiobuttons("age", "Age Range:", self.age_var, ["", "0-10", "11-20", "21-30", "31-40", "41-50", "51-60", "61-70", "71+"])
 
         self.gender_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Gender:", self.gender_var, ["", "male", "female"])
+        self.create_label_and_radiobuttons("gender", "Gender:", self.gender_var, ["", "male", "female"])
 
         self.expression_var = tk.StringVar()
-        self.create_label_and_radiobuttons("Expression:", self.expression_var, ["", "happy", "sad", "neutral", "angry", "surprised", "confused", "disgusted", "fearful"])
+        self.create_label_and_radiobuttons("expression", "Expression:", self.expression_var, ["", "happy", "sad", "neutral", "angry", "surprised", "confused", "disgusted", "fearful"])
 
         self.beard_var = tk.BooleanVar()
         self.mustache_var = tk.BooleanVar()
-        self.create_label_and_checkbutton("Beard:", self.beard_var)
-        self.create_label_and_checkbutton("Mustache:", self.mustache_var)
+        self.create_label_and_checkbutton("beard", "Beard:", self.beard_var)
+        self.create_label_and_checkbutton("mustache", "Mustache:", self.mustache_var)
 
     def create_label_and_entry(self, text, variable):
         frame = ttk.Frame(self.options_inner_frame)
@@ -355,22 +474,24 @@ class ImageAnnotator:
         entry = ttk.Entry(frame, textvariable=variable, width=30)
         entry.pack(side='left')
 
-    def create_label_and_checkbutton(self, text, variable):
+    def create_label_and_checkbutton(self, key, text, variable):
         frame = ttk.Frame(self.options_inner_frame)
         frame.pack(fill='x', padx=10, pady=5)
 
         label = ttk.Label(frame, text=text, font=("Helvetica", 10, "bold"), width=20, anchor='w')
         label.pack(side='left')
+        self.annotation_fields[key] = (variable, [True, False], label)
 
         checkbutton = ttk.Checkbutton(frame, variable=variable)
         checkbutton.pack(side='left')
 
-    def create_label_and_radiobuttons(self, text, variable, options):
+    def create_label_and_radiobuttons(self, key, text, variable, options):
         frame = ttk.Frame(self.options_inner_frame)
         frame.pack(fill='x', padx=10, pady=5)
 
         label = ttk.Label(frame, text=text, font=("Helvetica", 10, "bold"), width=20, anchor='w')
         label.pack(side='left')
+        self.annotation_fields[key] = (variable, options, label)
 
         button_frame = ttk.Frame(frame)
         button_frame.pack(side='left')
@@ -446,30 +567,34 @@ class ImageAnnotator:
         image_path = os.path.join(self.image_folder, self.image_list[self.current_image_index])
         image = Image.open(image_path)
         image.thumbnail((500, 500))
+        self.current_image = image
 
-        # Add a border around the image based on annotation status
         image_name = self.image_list[self.current_image_index]
-        border_color = "green" if image_name in self.annotations else "red"
-        image_with_border = ImageOps.expand(image, border=5, fill=border_color)
-
-        photo = ImageTk.PhotoImage(image_with_border)
-
-        self.image_label.config(image=photo)
-        self.image_label.image = photo
+        self.update_image_border()
 
         image_id = str(self.current_image_index + 1)
         dimensions = f"{image.width}x{image.height}"
 
-        self.id_var.set(image_id)
-        self.filename_var.set(image_name)
-        self.dimensions_var.set(dimensions)
+        self.set_if_changed(self.id_var, image_id)
+        self.set_if_changed(self.filename_var, image_name)
+        self.set_if_changed(self.dimensions_var, dimensions)
 
         if image_name in self.annotations:
             self.not_annotated_label.config(text="Annotated", foreground="green")
-            self.load_annotation_fields(image_name)
         else:
             self.not_annotated_label.config(text="Not Annotated", foreground="red")
-            self.clear_annotation_fields()
+        self.update_annotation_fields(self.annotations.get(image_name, {}))
+
+    def update_image_border(self):
+        # Add a border around the image based on annotation status, reusing the loaded thumbnail
+        image_name = self.image_list[self.current_image_index]
+        border_color = "green" if image_name in self.annotations else "red"
+        image_with_border = ImageOps.expand(self.current_image, border=5, fill=border_color)
+
+        photo = ImageTk.PhotoImage(image_with_border)
+
+        self.image_label.config(image=photo)
+        self.image_label.image = photo
 
     def display_omitted_image(self, event):
         selected_index = self.omitted_listbox.curselection()
@@ -485,66 +610,34 @@ class ImageAnnotator:
                 self.omitted_image_label.config(image=photo)
                 self.omitted_image_label.image = photo
 
+    def set_if_changed(self, variable, value):
+        # Setting a variable redraws its widgets, so skip values that are already current
+        if variable.get() != value:
+            variable.set(value)
+
+    def update_annotation_fields(self, annotation):
+        for key, (variable, _, _) in self.annotation_fields.items():
+            default = False if isinstance(variable, tk.BooleanVar) else ""
+            self.set_if_changed(variable, annotation.get(key, default))
+
     def load_annotation_fields(self, image_name):
-        annotation = self.annotations.get(image_name, {})
-        self.hair_color_var.set(annotation.get("hair_color", ""))
-        self.hair_length_var.set(annotation.get("hair_length", ""))
-        self.hair_style_var.set(annotation.get("hair_style", ""))
-        self.eye_color_var.set(annotation.get("eye_color", ""))
-        self.glasses_var.set(annotation.get("glasses", False))
-        self.glasses_type_var.set(annotation.get("glasses_type", ""))
-        self.hat_var.set(annotation.get("hat", False))
-        self.hat_type_var.set(annotation.get("hat_type", ""))
-        self.face_shape_var.set(annotation.get("face_shape", ""))
-        self.ethnicity_var.set(annotation.get("ethnicity", ""))
-        self.age_var.set(annotation.get("age", ""))
-        self.gender_var.set(annotation.get("gender", ""))
-        self.expression_var.set(annotation.get("expression", ""))
-        self.beard_var.set(annotation.get("beard", False))
-        self.mustache_var.set(annotation.get("mustache", False))
+        self.update_annotation_fields(self.annotations.get(image_name, {}))
 
     def clear_annotation_fields(self):
-        self.hair_color_var.set("")
-        self.hair_length_var.set("")
-        self.hair_style_var.set("")
-        self.eye_color_var.set("")
-        self.glasses_var.set(False)
-        self.glasses_type_var.set("")
-        self.hat_var.set(False)
-        self.hat_type_var.set("")
-        self.face_shape_var.set("")
-        self.ethnicity_var.set("")
-        self.age_var.set("")
-        self.gender_var.set("")
-        self.expression_var.set("")
-        self.beard_var.set(False)
-        self.mustache_var.set(False)
-
-    def save_annotation(self):
+        self.update_annotation_fields({})
+
+    def save_annotation(self, refresh=True):
         if self.current_image_index < 0 or self.current_image_index >= len(self.image_list):
-            return
+            return False
 
         image_name = self.image_list[self.current_image_index]
         annotation = {
             "id": self.id_var.get(),
             "filename": self.filename_var.get(),
-            "dimensions": self.dimensions_var.get(),
-            "hair_color": self.hair_color_var.get(),
-            "hair_length": self.hair_length_var.get(),
-            "hair_style": self.hair_style_var.get(),
-            "eye_color": self.eye_color_var.get(),
-            "glasses": self.glasses_var.get(),
-            "glasses_type": self.glasses_type_var.get(),
-            "hat": self.hat_var.get(),
-            "hat_type": self.hat_type_var.get(),
-            "face_shape": self.face_shape_var.get(),
-            "ethnicity": self.ethnicity_var.get(),
-            "age": self.age_var.get(),
-            "gender": self.gender_var.get(),
-            "expression": self.expression_var.get(),
-            "beard": self.beard_var.get(),
-            "mustache": self.mustache_var.get()
+            "dimensions": self.dimensions_var.get()
         }
+        for key, (variable, _, _) in self.annotation_fields.items():
+            annotation[key] = variable.get()
 
         # Check if any annotation has been made
         if any(annotation[key] for key in annotation if key not in ["id", "filename", "dimensions"]):
@@ -552,27 +645,81 @@ class ImageAnnotator:
 
             if self.output_folder:
                 output_file = os.path.join(self.output_folder, "annotations.json")
-                with open(output_file, 'w') as file:
-                    json.dump(self.annotations, file, indent=4)
+                self.write_annotations(output_file)
 
                 # Save the JSON file path to config
-                self.json_file = output_file
-                self.json_path_label.config(text=f"JSON File: {self.json_file}")
-                self.save_config()
+                if self.json_file != output_file:
+                    self.json_file = output_file
+                    self.json_path_label.config(text=f"JSON File: {self.json_file}")
+                    self.save_config()
 
-            self.not_annotated_label.config(text="Annotated", foreground="green")
             self.update_counter()
-            self.display_image()  # Update the border color immediately after saving
+            if refresh:
+                self.not_annotated_label.config(text="Annotated", foreground="green")
+                self.update_image_border()  # Update the border color immediately after saving
+            return True
+        return False
+
+    def write_annotations(self, output_file):
+        # Hand a snapshot to the writer thread; only the latest pending snapshot is written
+        with self.write_lock:
+            self.pending_write = (output_file, dict(self.annotations))
+        self.write_event.set()
+
+    def annotation_writer(self):
+        while True:
+            self.write_event.wait()
+            with self.write_lock:
+                pending = self.pending_write
+                self.pending_write = None
+                self.write_event.clear()
+                running = self.writer_running
+
+            if pending:
+                output_file, annotations = pending
+                temp_file = output_file + ".tmp"
+                try:
+                    with open(temp_file, 'w') as file:
+                        json.dump(annotations, file, indent=4)
+                    os.replace(temp_file, output_file)
+                except Exception as e:
+                    # Never touch Tk from this thread, the main thread polls the queue instead
+                    self.write_errors.put(f"Failed to save annotations: {e}")
+
+            if not running:
+                return
 
-    def next_image(self):
-        self.save_annotation()
+    def on_close(self):
+        # Flush any pending annotation write before exiting
+        with self.write_lock:
+            self.writer_running = False
+        self.write_event.set()
+        self.writer_thread.join()
+        self.show_write_errors()
+        self.root.destroy()
+
+    def check_write_errors(self):
+        self.show_write_errors()
+        self.root.after(500, self.check_write_errors)
+
+    def show_write_errors(self):
+        while True:
+            try:
+                error = self.write_errors.get_nowait()
+            except queue.Empty:
+                return
+            messagebox.showerror("Error", error)
+
+    def next_image(self, save=True):
+        if save:
+            self.save_annotation(refresh=False)
         self.current_image_index += 1
         if self.current_image_index >= len(self.image_list):
             self.current_image_index = 0
         self.display_image()
 
     def prev_image(self):
-        self.save_annotation()
+        self.save_annotation(refresh=False)
         self.current_image_index -= 1
         if self.current_image_index < 0:
             self.current_image_index = len(self.image_list) - 1
@@ -624,6 +771,126 @@ class ImageAnnotator:
 
         messagebox.showinfo("Info", "Image not found.")
 
+    def default_rapid_bindings(self):
+        bindings = {}
+        for key, (_, options, _) in self.annotation_fields.items():
+            values = [option for option in options if option != ""]
+            bindings[key] = dict(zip(RAPID_VALUE_KEYS, values))
+        return bindings
+
+    def toggle_rapid_mode_key(self, event):
+        if self.notebook.select() != str(self.annotation_frame):
+            return
+        if str(self.rapid_mode_check.cget('state')) == tk.DISABLED:
+            return
+        self.rapid_mode_var.set(not self.rapid_mode_var.get())
+        self.toggle_rapid_mode()
+
+    def toggle_rapid_mode(self):
+        for sequence in self.rapid_sequences:
+            self.root.unbind(sequence)
+        self.rapid_sequences = []
+        self.set_rapid_field_highlight(False)
+
+        if not self.rapid_mode_var.get():
+            self.rapid_hint_label.config(text="")
+            return
+
+        self.merge_rapid_config()
+        keys = set(self.rapid_keys.values())
+        for bindings in self.rapid_bindings.values():
+            keys.update(bindings)
+        invalid_keys = []
+        for key in keys:
+            sequence = f"<KeyPress-{key}>"
+            try:
+                self.root.bind(sequence, self.on_rapid_key)
+            except tk.TclError:
+                invalid_keys.append(key)
+                continue
+            self.rapid_sequences.append(sequence)
+        if invalid_keys:
+            messagebox.showerror("Error", f"Ignored invalid rapid mode keys: {', '.join(sorted(invalid_keys))}")
+
+        self.notebook.select(self.annotation_frame)
+        self.root.focus_set()
+        self.rapid_commit_count = 0
+        self.rapid_start_time = time.monotonic()
+        self.select_rapid_field(0)
+
+    def on_rapid_key(self, event):
+        # Rapid keys only apply while the Annotate page is showing
+        if self.notebook.select() != str(self.annotation_frame):
+            return
+        # Let the search and omit reason entries receive typed keys as usual
+        if isinstance(event.widget, tk.Entry):
+            return
+        if self.current_image_index < 0 or self.current_image_index >= len(self.image_list):
+            return
+
+        key = event.keysym
+        field = self.annotation_field_keys[self.rapid_field_index]
+        variable, _, _ = self.annotation_fields[field]
+
+        if key == self.rapid_keys['commit']:
+            self.rapid_commit()
+        elif key == self.rapid_keys['next_field']:
+            self.select_rapid_field(self.rapid_field_index + 1)
+        elif key == self.rapid_keys['prev_field']:
+            self.select_rapid_field(self.rapid_field_index - 1)
+        elif key == self.rapid_keys['clear']:
+            self.set_if_changed(variable, False if isinstance(variable, tk.BooleanVar) else "")
+        elif key in self.rapid_bindings.get(field, {}):
+            self.set_if_changed(variable, self.rapid_bindings[field][key])
+            self.select_rapid_field(self.rapid_field_index + 1)
+        return "break"
+
+    def rapid_commit(self):
+        if self.save_annotation(refresh=False):
+            self.rapid_commit_count += 1
+        self.next_image(save=False)
+        self.select_rapid_field(0)
+
+    def select_rapid_field(self, index):
+        index = max(0, min(index, len(self.annotation_field_keys) - 1))
+        self.set_rapid_field_highlight(False)
+        self.rapid_field_index = index
+        self.set_rapid_field_highlight(True)
+
+        field = self.annotation_field_keys[index]
+        _, _, label = self.annotation_fields[field]
+        choices = []
+        for key, value in self.rapid_bindings.get(field, {}).items():
+            if isinstance(value, bool):
+                value = "yes" if value else "no"
+            choices.append(f"{key}={value.capitalize()}")
+
+        elapsed = time.monotonic() - self.rapid_start_time
+        rate = self.rapid_commit_count * 3600 / elapsed if elapsed > 0 else 0
+        self.rapid_hint_label.config(text=(
+            f"{label.cget('text')} {'  '.join(choices)}\n"
+            f"{self.rapid_keys['clear']}=Clear  {self.rapid_keys['prev_field']}/{self.rapid_keys['next_field']}=Field  "
+            f"{self.rapid_keys['commit']}=Save & Next\n"
+            f"Rapid annotations: {self.rapid_commit_count} ({rate:.0f}/hour)"
+        ))
+
+        # Scroll the options canvas only when the selected field is out of view
+        row = label.master
+        inner_height = self.options_inner_frame.winfo_height()
+        if inner_height > 1:
+            top, bottom = self.options_frame.yview()
+            row_top = row.winfo_y() / inner_height
+            row_bottom = (row.winfo_y() + row.winfo_height()) / inner_height
+            if row_top < top or row_bottom > bottom:
+                self.options_frame.yview_moveto(row_top)
+
+    def set_rapid_field_highlight(self, active):
+        if not self.annotation_field_keys:
+            return
+        field = self.annotation_field_keys[self.rapid_field_index]
+        _, _, label = self.annotation_fields[field]
+        label.config(foreground="blue" if active else "")
+
     def update_counter(self):
         total_images = len(self.image_list)
         annotated_images = len(self.annotations)
@@ -641,6 +908,10 @@ class ImageAnnotator:
         self.next_unannotated_btn.config(state=state)
         self.search_btn.config(state=state)
         self.search_entry.config(state=state)
+        self.rapid_mode_check.config(state=state)
+        if state == tk.DISABLED and self.rapid_mode_var.get():
+            self.rapid_mode_var.set(False)
+            self.toggle_rapid_mode()
 
         for widget in self.options_inner_frame.winfo_children():
             if isinstance(widget, (tk.Button, ttk.Checkbutton, ttk.Radiobutton, ttk.Entry)):